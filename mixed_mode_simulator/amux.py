@@ -62,25 +62,25 @@ class AMUX:
 
     def drop_event(self, event):
         if self.debug:
-            print(f'{self.env.now*1e6:.3f} us\tEvent {event.detection_event_info["event_number"]}, sample number '
-                  f'{event.event_info["sample_index"]} '
+            print(f'{self.env.now*1e6:.3f} us\tEvent {event.detection_event_info.event_number}, sample number '
+                  f'{event.event_info.sample_index} '
                   f'dropped. No downstream channels available')
 
     def entry_point(self, channel_index: int, event: DownstreamEvent):
 
         if self.debug:
-            print(f'{self.env.now * 1e6:.3f} us\t AMUX:{self.unitID}, event {event.detection_event_info["event_number"]}'
-                  f':{event.event_info["sample_index"]} received')
+            print(f'{self.env.now * 1e6:.3f} us\t AMUX:{self.unitID}, event {event.detection_event_info.event_number}'
+                  f':{event.event_info.sample_index} received')
 
-        if event.event_info["sample_index"] == 0:
+        if event.event_info.sample_index == 0:
             yield self.env.timeout(self.amux_delay)
             try:
                 buffer = yield from self.acquire_buffer(channel_index)
                 self.active_channels[channel_index] = {"buffer": buffer}
                 yield from self.accept_event(event, channel_index)
             except BufferError as e:
-                print(f'{self.env.now:.3f} No buffers available, event {event.detection_event_info["event_number"]} '
-                      f'sample {event.event_info["sample_number"]} dropped')
+                print(f'{self.env.now:.3f} No buffers available, event {event.detection_event_info.event_number} '
+                      f'sample {event.event_info.sample_index} dropped')
 
         elif channel_index in self.active_channels:
             yield from self.accept_event(event, channel_index)
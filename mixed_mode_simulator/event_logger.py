@@ -48,8 +48,8 @@ class EventLogger:
 
         with self.lock.request() as req:  # FOR ASYNCRONOUS LOGGING
             yield req  # FOR ASYNCRONOUS LOGGING
-            event_id = f"{downstream_event.detection_event_info['scintillator']}:" \
-                       f"{downstream_event.detection_event_info['event_number']}"
+            event_id = f"{downstream_event.detection_event_info.scintillator}:" \
+                       f"{downstream_event.detection_event_info.event_number}"
             state_at_end = digitized  # Assuming 'event' in DownstreamEvent is a SimPy Event
             failure_location = f"{component}{unit_index}"
             event_success_value = 1  # Placeholder, can be changed as required
@@ -1,14 +1,52 @@
 import simpy
 
 
+class DetectionEventInfo:
+    __slots__ = ('event_number', 'scintillator', 'event_length')
+
+    def __init__(self, event_number: int, scintillator: int, event_length: float):
+        """
+        Information carried by a detection event from the scintillator.
+        :param event_number: index of the event within its scintillator
+        :param scintillator: index of the scintillator that detected the event
+        :param event_length: time over threshold of the event
+        """
+        self.event_number = event_number
+        self.scintillator = scintillator
+        self.event_length = event_length
+
+    def __repr__(self):
+        return (f'{{event_number: {self.event_number}, scintillator: {self.scintillator}, '
+                f'event_length: {self.event_length}}}')
+
+
+class EventInfo:
+    __slots__ = ('sample_index',)
+
+    def __init__(self, sample_index: int):
+        """
+        Information carried by a single downstream sample event.
+        :param sample_index: index of the sample within its parent detection event
+        """
+        self.sample_index = sample_index
+
+    def __repr__(self):
+        return f'{{sample_index: {self.sample_index}}}'
+
+
 class DetectionEvent:
-    def __init__(self, event: simpy.Event, event_info):
+    __slots__ = ('event', 'event_info')
+
+    def __init__(self, event: simpy.Event, event_info: DetectionEventInfo):
         self.event = event
         self.event_info = event_info
 
 
 class DownstreamEvent:
-    def __init__(self, event: simpy.Event, detection_event_info, event_info, final_event= False):
+    __slots__ = ('event', 'detection_event_info', 'event_info', 'final_event')
+
+    def __init__(self, event: simpy.Event, detection_event_info: DetectionEventInfo, event_info: EventInfo,
+                 final_event=False):
         """
         This defines the events that the integrator dispatches after the arrival of a detection event.
         :param event: Simpy Event
@@ -32,20 +32,20 @@ class Integrator:
     def process_event(self, detected_event: DetectionEvent):
         yield self.env.timeout(self.integrator_delay)
 
-        event_length = detected_event.event_info["event_length"]
+        event_length = detected_event.event_info.event_length
         downstream_events = math.ceil(event_length / self.sample_length)
 
         for downstream_event_index in range(downstream_events):
             new_sample_event = DownstreamEvent(simpy.Event(self.env), detected_event.event_info,
-                                               {"sample_index": downstream_event_index})
+                                               EventInfo(downstream_event_index))
             if downstream_event_index == downstream_events-1:
                 new_sample_event.final_event = True
             yield self.env.timeout(self.sample_length)
             if self.debug:
                 print(
-                    f'{self.env.now*1e6:.3f} us\tIn Integrator {self.integrator_index} with processed sample {downstream_event_index} for event {detected_event.event_info["event_number"]}')
+                    f'{self.env.now*1e6:.3f} us\tIn Integrator {self.integrator_index} with processed sample {downstream_event_index} for event {detected_event.event_info.event_number}')
 
             self.downstream_events_created += 1
             self.env.process(self.ring_buffer.buffer_in(new_sample_event))
 
-        # detected_event.event.succeed(value=f'Detection Event {detected_event.event_info["event_number"]} completed')
+        # detected_event.event.succeed(value=f'Detection Event {detected_event.event_info.event_number} completed')
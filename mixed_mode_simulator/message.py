@@ -1,4 +1,12 @@
+EDGE_RISING = 0
+EDGE_FALLING = 1
+EDGE_NAMES = ('Rising', 'Falling')
+
+
 class Message:
-    def __init__(self, data, event):
-        self.data = data
+    __slots__ = ('wave_id', 'edge', 'event')
+
+    def __init__(self, wave_id: int, edge: int, event):
+        self.wave_id = wave_id
+        self.edge = edge
         self.event = event
@@ -1,24 +1,27 @@
-from message import Message
-from single_channel_test import *
+import simpy
+from message import Message, EDGE_RISING, EDGE_FALLING, EDGE_NAMES
+
 
 def square_wave_generator(env, period, duration, integrator_process):
-    for i in itertools.count():
-        if i * period >= duration:
-            break
+    i = 0
+    while i * period < duration:
+        # Each edge waits for the previous one to be processed, so the wait between edges is always half a period
         event = simpy.Event(env)
         yield env.timeout(period / 2)
-        env.process(integrator_process(env, Message({'id': i, 'edge': 'Rising'}, event)))
+        env.process(integrator_process(env, Message(i, EDGE_RISING, event)))
         yield event  # Wait for the integrator to process the rising edge
         event = simpy.Event(env)
         yield env.timeout(period / 2)
-        env.process(integrator_process(env, Message({'id': i, 'edge': 'Falling'}, event)))
+        env.process(integrator_process(env, Message(i, EDGE_FALLING, event)))
         yield event  # Wait for the integrator to process the falling edge
+        i += 1
 
 
 def ping_pong_integrator(env, message, delta, size, RB_Length,Sample_Length):
+    from single_channel_test import ring_buffer_process
     size = size # Not sure how resorces work. But total size may be able to be determined by size*number of pingpong integrators
     yield env.timeout(delta)
-    print(f"Time {env.now}: Edge {message.data['edge']} of Wave {message.data['id']} processed.")
+    print(f"Time {env.now}: Edge {EDGE_NAMES[message.edge]} of Wave {message.wave_id} processed.")
     #message.event.succeed()  # Signal that the message has been processed
     env.process(ring_buffer_process(env, message, RB_Length, Sample_Length))# Change this to add parameters that can be inputter into the ping pon integrator.
 
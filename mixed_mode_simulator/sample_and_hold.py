@@ -1,9 +1,11 @@
 from __future__ import annotations
+import logging
 import simpy
 import itertools
 import numpy as np
 from events import *
 
+log = logging.getLogger(__name__)
 
 class AnalogBuffer:
 
@@ -23,41 +25,36 @@ class AnalogBuffer:
         :param amux: Downstream Amux object that this is connected to, all buffers in one layer should share this object.
         :param debug: Boolean flag for printing debug messages, default = `False`
 
+        NOTE: buffer_length, sample_length and chain_delay are read-only, the total chain latency is computed from
+        them once here.
         """
         self.amux = None
         self.buffer_index = buffer_index
         self.buffer_location = buffer_location
+        self._loc_prefix = f"{buffer_location}:{buffer_index}"
         self.env = env
-        self.sample_length = sample_length
-        self.buffer_length = buffer_length
-        self.chain_delay = chain_delay
+        self._env_process = env.process
+        self._sample_length = sample_length
+        self._buffer_length = buffer_length
+        self._chain_delay = chain_delay
+        self._chain_latency = buffer_length * (sample_length + chain_delay)  # Fixed for this buffer
         self.debug = debug
         self.downstream_events_processed = 0
 
-    def set_amux(self, amux: 'AMUX'):
-        self.amux = amux
-
-    def sample_and_hold_unit(self, event: DownstreamEvent, unit_index):
-        """
-        A single memory unit delay simulation
+    @property
+    def sample_length(self) -> float:
+        return self._sample_length
 
-        :param event: DownstreamEvent object that carries event information.
-        :param unit_index: accounting variable, used to show where in the chain of S&H units is this located.
-        :return: None
-        """
-        if self.debug:
-            print(
-                f'{self.env.now*1e6:.3f} us\tAt s&h unit {self.buffer_location}:{self.buffer_index}:{unit_index}, event {event.detection_event_info["event_number"]}, sample index '
-                f'{event.event_info["sample_index"]} starting processing '
-                f'at time {self.env.now}, amux is {self.amux}')
+    @property
+    def buffer_length(self) -> int:
+        return self._buffer_length
 
-        yield self.env.timeout(self.sample_length)
+    @property
+    def chain_delay(self) -> float:
+        return self._chain_delay
 
-        if self.debug:
-            print(
-                f'{self.env.now*1e6:.3f} us\tAt s&h unit {self.buffer_location}:{self.buffer_index}:{unit_index}, event {event.detection_event_info["event_number"]}, sample index'
-                f'{event.event_info["sample_index"]} finished processing '
-                f'at time {self.env.now}., amux is {self.amux}')
+    def set_amux(self, amux: 'AMUX'):
+        self.amux = amux
 
     def remove_from_buffer(self, event: DownstreamEvent, mux: 'AMUX'):
         """
@@ -69,41 +66,51 @@ class AnalogBuffer:
         :param mux: Multiplexer object that is used to chain the event.
         :return: None
         """
-        if self.debug:
-            print(f"{self.env.now*1e6:.3f} us\tAt remove from buffer @ {self.buffer_location}:{self.buffer_index}")
+        if __debug__ and self.debug:
+            log.debug('%.3f us\tAt remove from buffer @ %s', self.env.now * 1e6, self._loc_prefix)
         if mux is None:
             # event.event.fail(Exception(
             #     f"No downstream channels available at buffer located at {self.buffer_location}:{self.buffer_index}"))
-            if self.debug:
-                print(f"{self.env.now*1e6:.3f} us\tEvent failed, no downstream mux found!")
-
-                print(f'Event {event.detection_event_info["event_number"]}, sample {event.event_info["sample_index"]} '
-                      f'is out of the tail buffer')
+            if __debug__ and self.debug:
+                log.debug('%.3f us\tEvent failed, no downstream mux found!', self.env.now * 1e6)
+                log.debug('Event %s, sample %s is out of the tail buffer', event.detection_event_info.event_number,
+                          event.event_info.sample_index)
             self.downstream_events_processed += 1
 
         else:
-            yield self.env.process(mux.entry_point(self.buffer_index, event))
+            yield from mux.entry_point(self.buffer_index, event)  # Runs inside this process, no nested Process
 
     def buffer_in(self, event: DownstreamEvent):
         """
-        Creates an analog buffer by chaining sample and hold units.
+        Creates an analog buffer by chaining sample and hold units. Each S&H unit is modelled as a timeout of
+        `sample_length` followed by the chaining delay.
 
         :param event: DownstreamEvent object that carries event information.
         :return: None
         """
-        if self.debug:
-            print(f"{self.env.now*1e6:.3f} us\tIn buffer {self.buffer_location}:{self.buffer_index}, amux is {self.amux}")
-        for i in range(self.buffer_length):
-            yield self.env.process(self.sample_and_hold_unit(event, i))
-            yield self.env.timeout(self.chain_delay)  # Adding chaining delay overhead
-
-        if self.debug:
-            print(
-                f"{self.env.now*1e6:.3f} us\tcall to remove from buf @ {self.buffer_location}:{self.buffer_index}, amux is {self.amux}")
+        if __debug__ and self.debug:
+            log.debug('%.3f us\tIn buffer %s, amux is %s', self.env.now * 1e6, self._loc_prefix, self.amux)
+            for i in range(self.buffer_length):
+                log.debug('%.3f us\tAt s&h unit %s:%d, event %s, sample index %s starting processing at time %s, '
+                          'amux is %s', self.env.now * 1e6, self._loc_prefix, i,
+                          event.detection_event_info.event_number, event.event_info.sample_index, self.env.now,
+                          self.amux)
+                yield self.env.timeout(self.sample_length)
+                log.debug('%.3f us\tAt s&h unit %s:%d, event %s, sample index %s finished processing at time %s, '
+                          'amux is %s', self.env.now * 1e6, self._loc_prefix, i,
+                          event.detection_event_info.event_number, event.event_info.sample_index, self.env.now,
+                          self.amux)
+                yield self.env.timeout(self.chain_delay)  # Adding chaining delay overhead
+        else:
+            # Without debug output the individual S&H units are not observable, so the whole chain collapses into a
+            # single timeout.
+            yield self.env.timeout(self._chain_latency)
+
+        if __debug__ and self.debug:
+            log.debug('%.3f us\tcall to remove from buf @ %s, amux is %s', self.env.now * 1e6,
+                      self._loc_prefix, self.amux)
+        process_event = self._env_process(self.remove_from_buffer(event, self.amux))
         try:
-            process_event = self.env.process(self.remove_from_buffer(event, self.amux))
-            yield process_event
-            if not process_event.ok:
-                raise process_event.value  # Manually raise the exception if the process failed.
+            yield process_event  # Simpy throws the exception of a failed process back in here
         except Exception as e:
             print(f"{self.env.now*1e6:.3f} us\tCaught failed event {e}, simulation continues")
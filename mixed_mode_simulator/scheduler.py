@@ -0,0 +1,27 @@
+from __future__ import annotations
+import simpy
+from simpy.events import NORMAL, EventPriority
+
+
+class BoundedEnvironment(simpy.core.Environment):
+
+    def __init__(self, initial_time=0, capacity: int | None = None):
+        """
+        Opt-in simpy environment with an upper bound on the number of pending events. The event list itself is the
+        stock simpy heapq list, only scheduling is checked against the bound.
+
+        NOTE: Scheduled events cannot be discarded without corrupting the simulation, so a full event list raises an
+        OverflowError. Size `capacity` for the worst case number of in flight events.
+
+        NOTE: schedule() reads the length of simpy's private `_queue` event list, re-check it on simpy upgrades.
+
+        :param initial_time: starting simulation time, default = 0
+        :param capacity: maximum number of pending events, default = `None` (unbounded)
+        """
+        super().__init__(initial_time)
+        self.capacity = capacity
+
+    def schedule(self, event: simpy.Event, priority: EventPriority = NORMAL, delay=0) -> None:
+        if self.capacity is not None and len(self._queue) >= self.capacity:
+            raise OverflowError(f"Event list is full, capacity {self.capacity} reached at time {self.now}")
+        super().schedule(event, priority, delay)
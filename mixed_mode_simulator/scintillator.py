@@ -1,6 +1,6 @@
 import simpy
 import numpy as np
-from events import DetectionEvent
+from events import DetectionEvent, DetectionEventInfo
 from integrator import Integrator
 
 
@@ -51,8 +51,7 @@ class Scintillator:
         for i in range(self.num_events):
             # Define event information
             new_event = DetectionEvent(simpy.Event(self.env),
-                                       {"event_number": i, "scintillator": self.scintillator_index,
-                                        "event_length": event_lengths[i]})
+                                       DetectionEventInfo(i, self.scintillator_index, event_lengths[i]))
 
             # Schedule event with arrival time + scintillator delay
             if self.debug:
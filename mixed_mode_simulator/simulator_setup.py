@@ -1,5 +1,6 @@
 import argparse
 import json
+import logging
 import sys
 from datetime import datetime
 import simpy
@@ -10,6 +11,7 @@ import amux
 import integrator
 import scintillator
 import event_logger
+import scheduler
 
 # Define the argument parser
 parser = argparse.ArgumentParser(description='Simulation setup for signal processing')
@@ -38,6 +40,9 @@ parser.add_argument('--min_time_over_threshold', type=float, help='Minimum time
 parser.add_argument('--max_time_over_threshold', type=float, help='Maximum time over threshold for scintillator '
                                                                   'detection', default=None)
 parser.add_argument('--num_of_events', type=int, help='Number of simulated events', default=None)
+parser.add_argument('--max_pending_events', type=int, help='Upper bound on pending simulation events, the run stops '
+                                                          'with an OverflowError if it is exceeded. Unbounded if not '
+                                                          'set.', default=None)
 
 # Optional: Configuration file for overriding command line arguments
 parser.add_argument('--config_file', type=str, help='Path to JSON config file', default="default_config.json")
@@ -85,8 +90,16 @@ if __name__ == "__main__":
         print("Simulation Setup Variables:")
         print(json.dumps(config, indent=4))
         print("*" * 30, f'DEBUG LOG generated at {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', "*" * 30)
-
-    env = simpy.Environment()
+    # Only the simulator's own loggers are configured so third party debug output stays out of the debug log
+    debug_handler = logging.StreamHandler(sys.stdout)
+    debug_handler.setFormatter(logging.Formatter('%(message)s'))
+    sample_and_hold.log.addHandler(debug_handler)
+    sample_and_hold.log.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+
+    if args.max_pending_events is None:
+        env = simpy.Environment()
+    else:
+        env = scheduler.BoundedEnvironment(capacity=args.max_pending_events)
     logger = event_logger.EventLogger(f'events_log_{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', env, config=config, debug=True)
     digitizers = [digitizer.IdealDigitizer(env, logger, i, debug=DEBUG) for i in range(args.num_of_digitizers)]
     amux1 = amux.AMUX(env, args.num_long_buffs, digitizers, args.mux1_delay, debug=DEBUG)
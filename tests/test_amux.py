@@ -16,8 +16,8 @@ class TestAMUX(TestCase):
         self.buffers = [sample_and_hold.AnalogBuffer(self.env, i, "tail", 1, self.buffer_length, 0, debug=True) for i
                         in range(3)]
 
-        self.test_events = [events.DownstreamEvent(simpy.Event(self.env), {"event_number": 1, "scintillator": 1,
-                                                                           "event_length": 1}, {"sample_index": i})
+        self.test_events = [events.DownstreamEvent(simpy.Event(self.env), events.DetectionEventInfo(1, 1, 1),
+                                                   events.EventInfo(i))
                             for i in range(10)]
         self.amux_delay = 0
         self.amuxID = 0
@@ -35,8 +35,8 @@ class TestAMUX(TestCase):
         ring_buffer = sample_and_hold.AnalogBuffer(self.env, 0, "ring", 1, buffer_length, 0, debug=debug)
         ring_buffer.set_amux(mux)
 
-        test_event = events.DownstreamEvent(simpy.Event(self.env), {"event_number": 1, "scintillator": 1,
-                                                                    "event_length": 1}, {"sample_index": 0})
+        test_event = events.DownstreamEvent(simpy.Event(self.env), events.DetectionEventInfo(1, 1, 1),
+                                            events.EventInfo(0))
 
         self.env.process(ring_buffer.buffer_in(test_event))
         with self.assertRaises(Exception):
@@ -70,8 +70,8 @@ class TestAMUX(TestCase):
         for buf in self.ring:
             buf.set_amux(mux)
 
-        test_events = [events.DownstreamEvent(simpy.Event(self.env), {"event_number": i, "scintillator": i,
-                                                                      "event_length": 1}, {"sample_index": 0})
+        test_events = [events.DownstreamEvent(simpy.Event(self.env), events.DetectionEventInfo(i, i, 1),
+                                              events.EventInfo(0))
                        for i in range(4)]
 
         self.env.process(self.ring[1].buffer_in(test_events[1]))
@@ -95,11 +95,11 @@ class TestAMUX(TestCase):
         for buf in ring:
             buf.set_amux(mux)
 
-        test_events_0 = [events.DownstreamEvent(simpy.Event(self.env), {"event_number": i, "scintillator": i,
-                                                                        "event_length": 1}, {"sample_index": 0}, False)
+        test_events_0 = [events.DownstreamEvent(simpy.Event(self.env), events.DetectionEventInfo(i, i, 1),
+                                                events.EventInfo(0), False)
                          for i in range(4)]
-        test_events_1 = [events.DownstreamEvent(simpy.Event(self.env), {"event_number": i, "scintillator": i,
-                                                                        "event_length": 1}, {"sample_index": 1}, True)
+        test_events_1 = [events.DownstreamEvent(simpy.Event(self.env), events.DetectionEventInfo(i, i, 1),
+                                                events.EventInfo(1), True)
                          for i in range(4)]
 
         for buf in ring:
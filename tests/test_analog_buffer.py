@@ -1,6 +1,7 @@
 import unittest
 from mixed_mode_simulator import sample_and_hold
 from mixed_mode_simulator import events
+import numpy as np
 import simpy
 
 
@@ -10,14 +11,31 @@ class TestBuffer(unittest.TestCase):
         self.env = simpy.Environment()
         self.buffer_length = 5
         self.test_buffer = sample_and_hold.AnalogBuffer(self.env, 0, "ring", 1, self.buffer_length, 0, debug=True)
-        self.test_events = [events.DownstreamEvent(simpy.Event(self.env), {"event_number": 1, "scintillator": 1,
-                                                                           "event_length": 1}, {"sample_index": i})
-                            for i in range(10)]
+        self.num_events = 10
+        self._arr = np.zeros(self.num_events, dtype=[('event_number', 'i4'), ('scintillator', 'i4'),
+                                                     ('event_length', 'i4'), ('sample_index', 'i4')])
+        self._arr['event_number'] = 1
+        self._arr['scintillator'] = 1
+        self._arr['event_length'] = 1
+        self._arr['sample_index'] = np.arange(self.num_events)
+
+    def event(self, i) -> events.DownstreamEvent:
+        """
+        Builds the i-th test event from its row in the event array.
+        """
+        row = self._arr[i]
+        return events.DownstreamEvent(simpy.Event(self.env),
+                                      events.DetectionEventInfo(int(row['event_number']), int(row['scintillator']),
+                                                                int(row['event_length'])),
+                                      events.EventInfo(int(row['sample_index'])))
 
     def test_single_event(self):
-        self.env.process(self.test_buffer.buffer_in(self.test_events[0]))
-        self.env.run()
+        self.env.process(self.test_buffer.buffer_in(self.event(0)))
+        with self.assertLogs(sample_and_hold.__name__, 'DEBUG') as logs:
+            self.env.run()
         self.assertEqual(self.env.now, self.buffer_length)
+        self.assertTrue(any("At s&h unit ring:0:4, event 1, sample index 0 finished processing" in message
+                            for message in logs.output))
 
     def multiple_event_helper(self, num_events):
         """
@@ -25,7 +43,7 @@ class TestBuffer(unittest.TestCase):
         :return:
         """
         for i in range(num_events):
-            self.env.process(self.test_buffer.buffer_in(self.test_events[i]))
+            self.env.process(self.test_buffer.buffer_in(self.event(i)))
             yield self.env.timeout(1)
 
     def test_multiple_events(self):
@@ -10,8 +10,8 @@ class MyTestCase(unittest.TestCase):
         self.env = simpy.Environment()
         self.buffer_length = 5
         self.test_buffer = sample_and_hold.AnalogBuffer(self.env, -1, "ring", 1, self.buffer_length, 0, debug=False)
-        self.test_events = [events.DownstreamEvent(simpy.Event(self.env), {"event_number": 1, "scintillator": 1,
-                                                                           "event_length": 1}, {"sample_index": i})
+        self.test_events = [events.DownstreamEvent(simpy.Event(self.env), events.DetectionEventInfo(1, 1, 1),
+                                                   events.EventInfo(i))
                             for i in range(10)]
 
     def test_single_event(self):
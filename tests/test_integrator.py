@@ -22,8 +22,7 @@ class IntegratorTestCase(unittest.TestCase):
         """ Test if the correct number of downstream events are being generated given a test Detection Event."""
 
         test_event = events.DetectionEvent(simpy.Event(self.env),
-                                           event_info={"event_number": 0,
-                                                       "scintillator": 0, "event_length": event_length})
+                                           event_info=events.DetectionEventInfo(0, 0, event_length))
 
         test_ring = sample_and_hold.AnalogBuffer(self.env, 1, "ring-test", sample_length, 1, 0, self.DEBUG)
         integrator_test = integrator.Integrator(self.env, test_ring, 0, 0, sample_length, debug=False)
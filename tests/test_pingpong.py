@@ -0,0 +1,40 @@
+import unittest
+
+import simpy
+from mixed_mode_simulator import pingpong
+from mixed_mode_simulator import message
+
+
+class SquareWaveTestCase(unittest.TestCase):
+
+    def edge_helper(self, env, msg):
+        yield env.timeout(0)
+        self.edges.append((msg.wave_id, msg.edge))
+        msg.event.succeed()
+
+    def run_wave(self, period, duration, until=None):
+        self.edges = []
+        env = simpy.Environment()
+        env.process(pingpong.square_wave_generator(env, period, duration, self.edge_helper))
+        env.run(until=until)
+        return self.edges
+
+    def test_edge_count_non_integer_period(self):
+        """ The wave stops at the first cycle i with i * period >= duration, matching the float comparison."""
+        for period, duration, cycles in [(1e-7, 11e-7, 11), (0.3, 0.9, 4), (0.1, 3 * 0.1, 3), (5, 12, 3)]:
+            with self.subTest(period=period, duration=duration):
+                edges = self.run_wave(period, duration)
+                self.assertEqual(2 * cycles, len(edges))
+                self.assertEqual([(i // 2, message.EDGE_FALLING if i % 2 else message.EDGE_RISING)
+                                  for i in range(2 * cycles)], edges)
+
+    def test_no_edges_for_non_positive_duration(self):
+        self.assertEqual([], self.run_wave(5, 0))
+        self.assertEqual([], self.run_wave(5, -3))
+
+    def test_infinite_duration(self):
+        self.assertEqual(20, len(self.run_wave(1, float('inf'), until=10.25)))
+
+
+if __name__ == '__main__':
+    unittest.main()
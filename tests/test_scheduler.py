@@ -0,0 +1,33 @@
+import unittest
+
+from mixed_mode_simulator import scheduler
+
+
+class BoundedEnvironmentTestCase(unittest.TestCase):
+
+    def spawn_helper(self, env, count):
+        for _ in range(count):
+            env.timeout(1)
+        yield env.timeout(0)
+
+    def test_capacity_exceeded_during_run(self):
+        env = scheduler.BoundedEnvironment(capacity=4)
+        env.process(self.spawn_helper(env, 2))
+        env.run()
+        self.assertEqual(1, env.now)
+
+        env = scheduler.BoundedEnvironment(capacity=4)
+        env.process(self.spawn_helper(env, 4))
+        with self.assertRaises(OverflowError):
+            env.run()
+
+    def test_capacity_exceeded(self):
+        env = scheduler.BoundedEnvironment(capacity=2)
+        env.timeout(1)
+        env.timeout(2)
+        with self.assertRaises(OverflowError):
+            env.timeout(3)
+
+
+if __name__ == '__main__':
+    unittest.main()
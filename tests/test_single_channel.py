@@ -8,7 +8,7 @@ from sample_and_hold import *
 def ring_buffer_process(env, message, buffer_length, sample_length):
 
     yield env.process(ring_buffer(env, buffer_length, sample_length, debug=True))
-    print(f"Event Edge {message.data['edge']} of Wave {message.data['id']} through the ring buffer at time {env.now}")
+    print(f"Event Edge {EDGE_NAMES[message.edge]} of Wave {message.wave_id} through the ring buffer at time {env.now}")
 
     message.event.succeed()
 